@@ -1,21 +1,57 @@
 from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 
 from jinja2 import Environment, FileSystemLoader
 
 
-@dataclass
+# Stands in for the recipient's name so one render can be shared by everyone at a company.
+RECIPIENT_PLACEHOLDER = "\x00recruiter_name\x00"
+
+
+@dataclass(slots=True)
 class PersonalizedEmail:
     subject: str
     body: str
 
 
 class EmailPersonalizer:
-    def __init__(self, template_dir: str) -> None:
+    def __init__(self, template_dir: str, cache_size: int = 512) -> None:
         self.env = Environment(loader=FileSystemLoader(template_dir), autoescape=False)
         self.template = self.env.get_template("outreach_email.txt")
+        self._subject_fmt = "Interest in {job} at {company}".format
+        # Per-instance cache so entries never outlive the template they came from.
+        self._render_cached = lru_cache(maxsize=cache_size)(self._render)
+        self._substitutes_recipient = self._placeholder_round_trips()
 
-    def personalize(self, context: Dict[str, str]) -> PersonalizedEmail:
-        subject = f"Interest in {context.get('job_title', 'open role')} at {context.get('company_name', '')}".strip()
+    def _render(self, context_items: Tuple[Tuple[str, str], ...]) -> Tuple[str, str]:
+        context = dict(context_items)
+        subject = self._subject_fmt(
+            job=context.get("job_title", "open role"), company=context.get("company_name", "")
+        ).strip()
         body = self.template.render(subject=subject, **context)
-        return PersonalizedEmail(subject=subject, body=body)
+        return subject, body
+
+    def _placeholder_round_trips(self) -> bool:
+        # Substitution is only safe if the template prints recruiter_name verbatim
+        # (e.g. no |upper or |title); check once against a direct render.
+        probe = "Probe Name"
+        try:
+            direct = self.template.render(recruiter_name=probe)
+            shared = self.template.render(recruiter_name=RECIPIENT_PLACEHOLDER)
+        except Exception:
+            return False
+        return RECIPIENT_PLACEHOLDER in shared and shared.replace(RECIPIENT_PLACEHOLDER, probe) == direct
+
+    def personalize(self, context: Dict[str, str]) -> PersonalizedEmail:
+        recipient = context.get("recruiter_name")
+        if recipient is None or not self._substitutes_recipient:
+            subject, body = self._render_cached(tuple(sorted(context.items())))
+            return PersonalizedEmail(subject=subject, body=body)
+
+        shared = dict(context, recruiter_name=RECIPIENT_PLACEHOLDER)
+        subject, body = self._render_cached(tuple(sorted(shared.items())))
+        return PersonalizedEmail(
+            subject=subject.replace(RECIPIENT_PLACEHOLDER, recipient),
+            body=body.replace(RECIPIENT_PLACEHOLDER, recipient),
+        )
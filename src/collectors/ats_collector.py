@@ -1,12 +1,28 @@
 import csv
 import datetime as dt
+import threading
+from collections import Counter
 from dataclasses import dataclass
 from typing import Iterable, List, Dict
 
 import requests
 
+try:
+    import orjson
 
-@dataclass
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json
+
+    _loads = json.loads
+
+
+CSV_BUFFER_SIZE = 1 << 20
+# Each collector talks to a single ATS API host; cap in-flight requests to it.
+MAX_CONCURRENT_REQUESTS = 8
+
+
+@dataclass(slots=True)
 class CompanyJob:
     company_name: str
     job_title: str
@@ -15,73 +31,80 @@ class CompanyJob:
     company_domain: str | None = None
 
 
+def _nested(record: dict, outer: str, inner: str, default: str = "") -> str:
+    try:
+        return record[outer][inner]
+    except (KeyError, TypeError):
+        return default
+
+
 class GreenhouseCollector:
-    def __init__(self, session: requests.Session | None = None) -> None:
+    def __init__(
+        self, session: requests.Session | None = None, max_concurrency: int = MAX_CONCURRENT_REQUESTS
+    ) -> None:
         self.session = session or requests.Session()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
 
     def fetch_jobs(self, company_slug: str, careers_url: str) -> List[CompanyJob]:
         api_url = f"https://boards-api.greenhouse.io/v1/boards/{company_slug}/jobs"
         try:
-            response = self.session.get(api_url, timeout=20)
+            with self._slots:
+                response = self.session.get(api_url, timeout=20)
             response.raise_for_status()
-            payload = response.json()
+            payload = _loads(response.content)
         except (requests.RequestException, ValueError) as exc:
             print(f"[warn] Greenhouse fetch failed for {company_slug}: {exc}")
             return []
-        jobs: List[CompanyJob] = []
-        for job in payload.get("jobs", []):
-            location = job.get("location", {}).get("name", "")
-            jobs.append(
-                CompanyJob(
-                    company_name=job.get("company_name", company_slug),
-                    job_title=job.get("title", ""),
-                    location=location,
-                    careers_url=careers_url,
-                )
+        return [
+            CompanyJob(
+                company_name=job.get("company_name", company_slug),
+                job_title=job.get("title", ""),
+                location=_nested(job, "location", "name"),
+                careers_url=careers_url,
             )
-        return jobs
+            for job in payload.get("jobs", [])
+        ]
 
 
 class LeverCollector:
-    def __init__(self, session: requests.Session | None = None) -> None:
+    def __init__(
+        self, session: requests.Session | None = None, max_concurrency: int = MAX_CONCURRENT_REQUESTS
+    ) -> None:
         self.session = session or requests.Session()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
 
     def fetch_jobs(self, company_slug: str, careers_url: str) -> List[CompanyJob]:
         api_url = f"https://api.lever.co/v0/postings/{company_slug}?mode=json"
         try:
-            response = self.session.get(api_url, timeout=20)
+            with self._slots:
+                response = self.session.get(api_url, timeout=20)
             response.raise_for_status()
-            payload = response.json()
+            payload = _loads(response.content)
         except (requests.RequestException, ValueError) as exc:
             print(f"[warn] Lever fetch failed for {company_slug}: {exc}")
             return []
-        jobs: List[CompanyJob] = []
-        for job in payload:
-            location = job.get("categories", {}).get("location", "")
-            jobs.append(
-                CompanyJob(
-                    company_name=job.get("company", company_slug),
-                    job_title=job.get("text", ""),
-                    location=location,
-                    careers_url=careers_url,
-                )
+        return [
+            CompanyJob(
+                company_name=job.get("company", company_slug),
+                job_title=job.get("text", ""),
+                location=_nested(job, "categories", "location"),
+                careers_url=careers_url,
             )
-        return jobs
+            for job in payload
+        ]
 
 
 def write_companies_csv(path: str, jobs: Iterable[CompanyJob]) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as handle:
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as handle:
         writer = csv.writer(handle)
         writer.writerow(["company_name", "job_title", "location", "careers_url", "company_domain"])
-        for job in jobs:
-            writer.writerow(
-                [job.company_name, job.job_title, job.location, job.careers_url, job.company_domain or ""]
-            )
+        writer.writerows(
+            (job.company_name, job.job_title, job.location, job.careers_url, job.company_domain or "")
+            for job in jobs
+        )
 
 
 def log_collection_summary(jobs: Iterable[CompanyJob]) -> Dict[str, int]:
-    summary: Dict[str, int] = {}
-    for job in jobs:
-        summary[job.company_name] = summary.get(job.company_name, 0) + 1
-    summary["collected_at"] = int(dt.datetime.utcnow().timestamp())
+    summary: Dict[str, int] = dict(Counter(job.company_name for job in jobs))
+    summary["collected_at"] = int(dt.datetime.now(dt.timezone.utc).timestamp())
     return summary
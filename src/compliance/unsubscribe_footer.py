@@ -1,9 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnsubscribeFooter:
     text: str
+    _rendered: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The footer is identical for every message in a batch; format it once.
+        object.__setattr__(self, "_rendered", f"\n\n---\n{self.text}")
 
     def render(self) -> str:
-        return f"\n\n---\n{self.text}"
+        return self._rendered
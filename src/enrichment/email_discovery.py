@@ -1,12 +1,11 @@
-import re
 from dataclasses import dataclass
 from typing import List
 from urllib.parse import urlparse
 
-from .email_validator import EmailValidator
+from .email_validator import EmailValidator, is_domain_shaped
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredEmail:
     recruiter_name: str
     email: str
@@ -40,6 +39,10 @@ def _name_parts(name: str) -> tuple[str, str]:
 def discover_emails(
     recruiter_name: str, company_domain: str, validator: EmailValidator
 ) -> List[DiscoveredEmail]:
+    # Candidates are built from name parts and the domain, so one domain check covers them all.
+    company_domain = company_domain.lower()
+    if not is_domain_shaped(company_domain):
+        return []
     first, last = _name_parts(recruiter_name)
     candidates = []
     if first and last:
@@ -54,8 +57,6 @@ def discover_emails(
     results: List[DiscoveredEmail] = []
     for email in candidates:
         normalized = email.lower()
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", normalized):
-            continue
         score = validator.validate(normalized)
         results.append(
             DiscoveredEmail(
@@ -1,28 +1,83 @@
-import re
 import smtplib
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 
-EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+def is_domain_shaped(domain: str) -> bool:
+    # No '@' or whitespace, and a dot with something on both sides.
+    return "@" not in domain and domain.split() == [domain] and "." in domain[1:-1]
 
 
-@dataclass
+def is_email_shaped(email: str) -> bool:
+    # Plain string checks equivalent to ^[^@\s]+@[^@\s]+\.[^@\s]+$
+    local, _, domain = email.partition("@")
+    return bool(local) and local.split() == [local] and is_domain_shaped(domain)
+
+
+@dataclass(slots=True)
 class EmailValidator:
     smtp_host: Optional[str] = None
     smtp_port: int = 25
     timeout: int = 10
+    # hr@/careers@ candidates repeat for every recruiter at a domain; score each address once.
+    _scores: Dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # One probe connection per validator, reused across candidates.
+    _server: Optional[smtplib.SMTP] = field(default=None, init=False, repr=False, compare=False)
+
+    def __enter__(self) -> "EmailValidator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+    def _ensure(self) -> smtplib.SMTP:
+        if self._server is None:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout)
+            try:
+                server.ehlo()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+                raise
+            self._server = server
+        return self._server
 
     def validate(self, email: str) -> float:
-        if not EMAIL_PATTERN.match(email):
+        score = self._scores.get(email)
+        if score is None:
+            score = self._scores[email] = self._score(email)
+        return score
+
+    def _score(self, email: str) -> float:
+        if not is_email_shaped(email):
             return 0.0
 
         if not self.smtp_host:
             return 0.5
 
+        reused = self._server is not None
         try:
-            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout) as server:
-                server.noop()
+            try:
+                self._ensure().noop()
+            except smtplib.SMTPServerDisconnected:
+                if not reused:
+                    raise
+                # The server may drop an idle or NOOP-heavy connection; re-probe once on a fresh one.
+                self._server.close()
+                self._server = None
+                self._ensure().noop()
             return 0.7
         except (smtplib.SMTPException, OSError):
+            # Drop the broken connection; the next candidate reconnects.
+            if self._server is not None:
+                self._server.close()
+                self._server = None
             return 0.4
@@ -1,9 +1,12 @@
+import codecs
 import re
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 RECRUITER_KEYWORDS = (
@@ -14,8 +17,33 @@ RECRUITER_KEYWORDS = (
     "human resources",
 )
 
+RECRUITER_ROLES = ("Recruiter", "Talent Acquisition", "HR", "Human Resources")
 
-@dataclass
+# Case-sensitive on purpose: names must be capitalised, and the bounded,
+# lazy gap keeps matching linear on long pages.
+RECRUITER_PATTERN = re.compile(
+    r"\b([A-Z][a-z]{1,20}\s{1,10}[A-Z][a-z]{1,20})[^\n]{0,60}?(" + "|".join(RECRUITER_ROLES) + r")\b"
+)
+# Longer than any RECRUITER_PATTERN match, so a match split across chunks is rescanned whole.
+CHUNK_OVERLAP = 256
+CHUNK_SIZE = 65536
+MAX_RECRUITER_MATCHES = 50
+# Sized to the fetch pool in main so concurrent lookups never overflow it.
+SESSION_POOL_SIZE = 32
+
+# Shared across calls so repeated careers-page hosts reuse keep-alive connections.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=SESSION_POOL_SIZE,
+        pool_maxsize=SESSION_POOL_SIZE,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+    ),
+)
+
+
+@dataclass(slots=True)
 class RecruiterContact:
     company_name: str
     recruiter_name: str
@@ -29,6 +57,52 @@ def _extract_domain(url: str) -> str:
     return parsed.netloc
 
 
+def _mentions_role(text: str) -> bool:
+    # Substring search is far cheaper than running the pattern over a page with no role in it.
+    return any(role in text for role in RECRUITER_ROLES)
+
+
+def _usable_encoding(encoding: Optional[str]) -> str:
+    # iter_content raises LookupError (not a RequestException) on a charset Python doesn't know.
+    if encoding is None:
+        return "utf-8"
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return "utf-8"
+    return encoding
+
+
+def _scan_recruiter_matches(chunks: Iterable[str], limit: int) -> List[Tuple[str, str]]:
+    matches: List[Tuple[str, str]] = []
+    tail = ""
+    # The carried tail keeps one character of context before the scan start, so the
+    # pattern's leading \b sees the real preceding character (finditer's pos honours it).
+    lead = 0
+    for chunk in chunks:
+        buffer = tail + chunk
+        cut = len(buffer) - CHUNK_OVERLAP
+        start = max(cut, lead)
+        if _mentions_role(buffer):
+            for match in RECRUITER_PATTERN.finditer(buffer, lead):
+                # Matches starting in the overlap are picked up again with the next chunk.
+                if match.start() >= cut:
+                    break
+                matches.append((match.group(1).strip(), match.group(2).strip()))
+                if len(matches) >= limit:
+                    return matches
+                start = match.end()
+        lead = 1 if start > 0 else 0
+        tail = buffer[start - lead:]
+    if not _mentions_role(tail):
+        return matches
+    for match in RECRUITER_PATTERN.finditer(tail, lead):
+        matches.append((match.group(1).strip(), match.group(2).strip()))
+        if len(matches) >= limit:
+            break
+    return matches
+
+
 def identify_recruiters(company_name: str, careers_url: str) -> List[RecruiterContact]:
     """
     Identify recruiter contacts by scanning public careers or people pages.
@@ -36,9 +110,12 @@ def identify_recruiters(company_name: str, careers_url: str) -> List[RecruiterCo
     """
     recruiters: List[RecruiterContact] = []
     try:
-        response = requests.get(careers_url, timeout=20)
-        response.raise_for_status()
-        text = response.text
+        with _SESSION.get(careers_url, stream=True, timeout=20) as response:
+            response.raise_for_status()
+            response.encoding = _usable_encoding(response.encoding)
+            matches = _scan_recruiter_matches(
+                response.iter_content(chunk_size=CHUNK_SIZE, decode_unicode=True), MAX_RECRUITER_MATCHES
+            )
     except requests.RequestException:
         return [
             RecruiterContact(
@@ -50,13 +127,7 @@ def identify_recruiters(company_name: str, careers_url: str) -> List[RecruiterCo
             )
         ]
 
-    for match in re.finditer(
-        r"([A-Z][a-z]+\s+[A-Z][a-z]+)[^\n]{0,60}(Recruiter|Talent Acquisition|HR|Human Resources)",
-        text,
-        re.IGNORECASE,
-    ):
-        name = match.group(1).strip()
-        role = match.group(2).strip()
+    for name, role in matches:
         recruiters.append(
             RecruiterContact(
                 company_name=company_name,
@@ -1,30 +1,33 @@
 import csv
 import datetime as dt
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from typing import Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimiter:
     daily_limit: int
     min_seconds_between_sends: int
+    _today_prefix: str = field(init=False, repr=False)
+    _today_count: int = field(default=0, init=False, repr=False)
 
-    def sent_today(self, log_rows: Iterable[dict]) -> int:
-        today = dt.date.today().isoformat()
-        count = 0
-        for row in log_rows:
-            timestamp = row.get("timestamp", "")
-            if timestamp.startswith(today):
-                count += 1
-        return count
+    def __post_init__(self) -> None:
+        self._today_prefix = dt.date.today().isoformat()
 
-    def can_send(self, log_rows: Iterable[dict]) -> bool:
-        return self.sent_today(log_rows) < self.daily_limit
+    def observe(self, row: dict) -> None:
+        if (row.get("timestamp") or "").startswith(self._today_prefix):
+            self._today_count += 1
 
+    def record(self) -> None:
+        self._today_count += 1
 
-def read_logs(path: str) -> list[dict]:
+    def can_send(self) -> bool:
+        return self._today_count < self.daily_limit
+
+
+def iter_logs(path: str) -> Iterator[dict]:
     try:
         with open(path, newline="", encoding="utf-8") as handle:
-            return list(csv.DictReader(handle))
+            yield from csv.DictReader(handle)
     except FileNotFoundError:
-        return []
+        return
@@ -1,13 +1,14 @@
 import os
 import smtplib
+import threading
 from dataclasses import dataclass
 from email.message import EmailMessage
 import mimetypes
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class SmtpConfig:
     host: str
     port: int
@@ -18,56 +19,165 @@ class SmtpConfig:
 
 
 class SmtpSender:
-    def __init__(self, config: SmtpConfig) -> None:
+    """
+    Send outreach emails over SMTP.
+
+    Used as a context manager, one authenticated connection is kept open for
+    the whole batch and recycled every ``messages_per_connection`` messages.
+    Outside a ``with`` block each ``send_email`` call connects and disconnects.
+    """
+
+    def __init__(self, config: SmtpConfig, messages_per_connection: int = 1000) -> None:
         self.config = config
+        self.messages_per_connection = messages_per_connection
+        self.server: Optional[smtplib.SMTP] = None
+        self._persistent = False
+        self._sent_on_connection = 0
+        # The same resume goes out with every message; read it from disk only once.
+        self._attachment_cache: Dict[str, Tuple[bytes, str, str, str]] = {}
 
-    def send_email(
+    def __enter__(self) -> "SmtpSender":
+        # Connect lazily on the first send so a bad server fails that send, not the batch.
+        self._persistent = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._persistent = False
+        self.close()
+
+    def connect(self) -> None:
+        # Use implicit SSL for port 465, otherwise use STARTTLS
+        if self.config.port == 465:
+            server = smtplib.SMTP_SSL(self.config.host, self.config.port)
+        else:
+            server = smtplib.SMTP(self.config.host, self.config.port)
+        try:
+            # For non-SSL connections, attempt STARTTLS
+            if self.config.port != 465:
+                try:
+                    server.starttls()
+                except Exception:
+                    # If STARTTLS fails, continue and let login raise if necessary
+                    print("[warn] STARTTLS failed or not supported by server; continuing without STARTTLS")
+            server.login(self.config.username, self.config.password)
+        except Exception:
+            server.close()
+            raise
+        self.server = server
+        self._sent_on_connection = 0
+
+    def close(self) -> None:
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):
+            self.server.close()
+        self.server = None
+
+    def _load_attachment(self, attachment_path: str) -> Optional[Tuple[bytes, str, str, str]]:
+        cached = self._attachment_cache.get(attachment_path)
+        if cached:
+            return cached
+        attachment = Path(attachment_path)
+        if not attachment.exists():
+            return None
+        mime_type, _ = mimetypes.guess_type(str(attachment))
+        if mime_type:
+            maintype, subtype = mime_type.split("/", 1)
+        else:
+            maintype, subtype = "application", "octet-stream"
+        cached = (attachment.read_bytes(), maintype, subtype, attachment.name)
+        self._attachment_cache[attachment_path] = cached
+        return cached
+
+    def build_message(
         self,
         recipient: str,
         subject: str,
         body: str,
         attachment_path: str,
-    ) -> None:
+    ) -> EmailMessage:
         message = EmailMessage()
         message["Subject"] = subject
         message["From"] = f"{self.config.sender_name} <{self.config.sender_email}>"
         message["To"] = recipient
         message.set_content(body)
 
-        attachment = Path(attachment_path)
-        if attachment.exists():
-            mime_type, _ = mimetypes.guess_type(str(attachment))
-            if mime_type:
-                maintype, subtype = mime_type.split("/", 1)
-            else:
-                maintype, subtype = "application", "octet-stream"
-            with attachment.open("rb") as handle:
-                message.add_attachment(
-                    handle.read(),
-                    maintype=maintype,
-                    subtype=subtype,
-                    filename=attachment.name,
-                )
+        attachment = self._load_attachment(attachment_path)
+        if attachment:
+            data, maintype, subtype, filename = attachment
+            message.add_attachment(data, maintype=maintype, subtype=subtype, filename=filename)
         else:
             # Attachment missing - warn and continue without attachment
-            print(f"[warn] Attachment not found at {attachment}; sending without attachment")
+            print(f"[warn] Attachment not found at {attachment_path}; sending without attachment")
+        return message
 
-        # Use implicit SSL for port 465, otherwise use STARTTLS
-        if self.config.port == 465:
-            server_ctx = smtplib.SMTP_SSL(self.config.host, self.config.port)
-        else:
-            server_ctx = smtplib.SMTP(self.config.host, self.config.port)
+    def send_prepared(self, message: EmailMessage) -> None:
+        if self.server is not None and self._sent_on_connection >= self.messages_per_connection:
+            self.close()
+        if self.server is None:
+            self.connect()
+        try:
+            self.server.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # Long-lived connections can be dropped by the server while idle; retry once.
+            self.server.close()
+            self.server = None
+            self.connect()
+            self.server.send_message(message)
+        self._sent_on_connection += 1
 
-        with server_ctx as server:
-            # For non-SSL connections, attempt STARTTLS
-            if self.config.port != 465:
-                try:
-                    server.starttls()
-                except Exception:
-                    # If STARTTLS fails, continue and let login raise if necessary
-                    print("[warn] STARTTLS failed or not supported by server; continuing without STARTTLS")
-            server.login(self.config.username, self.config.password)
-            server.send_message(message)
+    def send_email(
+        self,
+        recipient: str,
+        subject: str,
+        body: str,
+        attachment_path: str,
+    ) -> None:
+        message = self.build_message(recipient, subject, body, attachment_path)
+        if self._persistent:
+            self.send_prepared(message)
+            return
+        try:
+            self.send_prepared(message)
+        finally:
+            self.close()
+
+
+class SmtpSenderPool:
+    """
+    Give each worker thread its own persistent SmtpSender so sends can overlap.
+    SMTP connections are not safe to share between threads.
+    """
+
+    def __init__(self, config: SmtpConfig, messages_per_connection: int = 1000) -> None:
+        self.config = config
+        self.messages_per_connection = messages_per_connection
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._senders: List[SmtpSender] = []
+
+    def __enter__(self) -> "SmtpSenderPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def sender(self) -> SmtpSender:
+        sender = getattr(self._local, "sender", None)
+        if sender is None:
+            sender = SmtpSender(self.config, self.messages_per_connection).__enter__()
+            self._local.sender = sender
+            with self._lock:
+                self._senders.append(sender)
+        return sender
+
+    def close(self) -> None:
+        with self._lock:
+            senders, self._senders = self._senders, []
+        for sender in senders:
+            sender.__exit__(None, None, None)
 
 
 def load_smtp_config() -> Optional[SmtpConfig]:
@@ -79,13 +189,14 @@ def load_smtp_config() -> Optional[SmtpConfig]:
         "SMTP_SENDER_NAME",
         "SMTP_SENDER_EMAIL",
     ]
-    if not all(os.getenv(key) for key in required):
+    env = {key: os.environ.get(key) for key in required}
+    if not all(env.values()):
         return None
     return SmtpConfig(
-        host=os.environ["SMTP_HOST"],
-        port=int(os.environ.get("SMTP_PORT", "587")),
-        username=os.environ["SMTP_USERNAME"],
-        password=os.environ["SMTP_PASSWORD"],
-        sender_name=os.environ["SMTP_SENDER_NAME"],
-        sender_email=os.environ["SMTP_SENDER_EMAIL"],
+        host=env["SMTP_HOST"],
+        port=int(env["SMTP_PORT"]),
+        username=env["SMTP_USERNAME"],
+        password=env["SMTP_PASSWORD"],
+        sender_name=env["SMTP_SENDER_NAME"],
+        sender_email=env["SMTP_SENDER_EMAIL"],
     )
@@ -1,75 +1,45 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import csv
 import datetime as dt
+from functools import lru_cache
+from itertools import chain
 import os
 from pathlib import Path
 import re
 import shutil
-from typing import Dict, List
+from typing import Dict, List, TextIO
 
+import requests
+from requests.adapters import HTTPAdapter
 import yaml
 from dotenv import load_dotenv
 
-from collectors.ats_collector import GreenhouseCollector, LeverCollector, write_companies_csv
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to per-state substring checks
+    ahocorasick = None
+
+from collectors.ats_collector import CompanyJob, GreenhouseCollector, LeverCollector, write_companies_csv
 from enrichment.recruiter_identifier import identify_recruiters
-from enrichment.email_discovery import discover_from_careers_url
+from enrichment.email_discovery import DiscoveredEmail, discover_from_careers_url
 from enrichment.email_validator import EmailValidator
 from ai.email_personalizer import EmailPersonalizer
 from compliance.unsubscribe_footer import UnsubscribeFooter
-from mailer.rate_limiter import RateLimiter, read_logs
-from mailer.smtp_sender import SmtpSender, load_smtp_config
-
-
-def load_yaml(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
-
-
-def write_recruiters_csv(path: str, recruiters: list) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(["company_name", "recruiter_name", "role", "profile_url", "source"])
-        for recruiter in recruiters:
-            writer.writerow(
-                [
-                    recruiter.company_name,
-                    recruiter.recruiter_name,
-                    recruiter.role,
-                    recruiter.profile_url,
-                    recruiter.source,
-                ]
-            )
-
-
-def write_emails_csv(path: str, emails: list) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(["recruiter_name", "email", "confidence_score", "source"])
-        for email in emails:
-            writer.writerow([email.recruiter_name, email.email, email.confidence_score, email.source])
+from mailer.rate_limiter import RateLimiter, iter_logs
+from mailer.smtp_sender import SmtpSenderPool, load_smtp_config
 
 
-def write_job_board_urls_csv(path: str, boards: list) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(["name", "search_url", "note"])
-        for board in boards:
-            writer.writerow([board.get("name", ""), board.get("search_url", ""), board.get("note", "")])
+FETCH_WORKERS = 32
+LOG_FIELDS = ["email", "company", "timestamp", "status"]
+CSV_BUFFER_SIZE = 1 << 20
+# libyaml-backed loader when PyYAML was built with it; same safe subset either way.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
-def is_us_location(location: str) -> bool:
-    if not location:
-        return False
-    normalized = location.strip().lower()
-    if not normalized:
-        return False
-    if "united states" in normalized or "united states of america" in normalized:
-        return True
-    if re.search(r"\busa\b", normalized) or re.search(r"\bu\.s\.a\.?\b", normalized):
-        return True
-    if re.search(r"\bu\.s\.?\b", normalized) or re.search(r"\bus\b", normalized):
-        return True
-    us_state_names = {
+US_STATE_NAMES = frozenset(
+    {
         "alabama",
         "alaska",
         "arizona",
@@ -122,72 +92,184 @@ def is_us_location(location: str) -> bool:
         "wyoming",
         "district of columbia",
     }
-    if any(state in normalized for state in us_state_names):
+)
+US_STATE_ABBREVS = (
+    "AL",
+    "AK",
+    "AZ",
+    "AR",
+    "CA",
+    "CO",
+    "CT",
+    "DE",
+    "FL",
+    "GA",
+    "HI",
+    "ID",
+    "IL",
+    "IN",
+    "IA",
+    "KS",
+    "KY",
+    "LA",
+    "ME",
+    "MD",
+    "MA",
+    "MI",
+    "MN",
+    "MS",
+    "MO",
+    "MT",
+    "NE",
+    "NV",
+    "NH",
+    "NJ",
+    "NM",
+    "NY",
+    "NC",
+    "ND",
+    "OH",
+    "OK",
+    "OR",
+    "PA",
+    "RI",
+    "SC",
+    "SD",
+    "TN",
+    "TX",
+    "UT",
+    "VT",
+    "VA",
+    "WA",
+    "WV",
+    "WI",
+    "WY",
+    "DC",
+)
+
+
+def _build_state_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for state in US_STATE_NAMES:
+        automaton.add_word(state, state)
+    automaton.make_automaton()
+    return automaton
+
+
+# Finds any state name in a single pass instead of one substring scan per state.
+US_STATE_AUTOMATON = _build_state_automaton()
+US_COUNTRY_PATTERN = re.compile(r"united states|\b(?:usa|u\.s\.a\.?|u\.s\.?|us)\b")
+US_STATE_ABBREV_PATTERN = re.compile(r"\b(" + "|".join(US_STATE_ABBREVS) + r")\b", re.IGNORECASE)
+
+
+def build_session(pool_size: int = FETCH_WORKERS) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+    return session
+
+
+def fetch_source(collector, entry: dict) -> list:
+    fetched = collector.fetch_jobs(entry["company_slug"], entry["careers_url"])
+    company_domain = entry.get("company_domain")
+    for job in fetched:
+        job.company_domain = company_domain
+    return fetched
+
+
+def load_yaml(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=YAML_LOADER) or {}
+
+
+def write_recruiters_csv(path: str, recruiters: list) -> None:
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["company_name", "recruiter_name", "role", "profile_url", "source"])
+        writer.writerows(
+            (
+                recruiter.company_name,
+                recruiter.recruiter_name,
+                recruiter.role,
+                recruiter.profile_url,
+                recruiter.source,
+            )
+            for recruiter in recruiters
+        )
+
+
+def write_emails_csv(path: str, emails: list) -> None:
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["recruiter_name", "email", "confidence_score", "source"])
+        writer.writerows(
+            (email.recruiter_name, email.email, email.confidence_score, email.source) for email in emails
+        )
+
+
+def write_job_board_urls_csv(path: str, boards: list) -> None:
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["name", "search_url", "note"])
+        writer.writerows(
+            (board.get("name", ""), board.get("search_url", ""), board.get("note", "")) for board in boards
+        )
+
+
+def mentions_us_state(normalized: str) -> bool:
+    if US_STATE_AUTOMATON is not None:
+        return next(US_STATE_AUTOMATON.iter(normalized), None) is not None
+    return any(state in normalized for state in US_STATE_NAMES)
+
+
+# Boards repeat the same handful of location strings across many postings.
+@lru_cache(maxsize=4096)
+def is_us_location(location: str) -> bool:
+    if not location:
+        return False
+    normalized = location.strip().lower()
+    if not normalized:
+        return False
+    # Cheapest, most common signals first; the full state-name scan runs last.
+    if US_COUNTRY_PATTERN.search(normalized):
+        return True
+    if US_STATE_ABBREV_PATTERN.search(location):
         return True
-    us_state_abbrevs = [
-        "AL",
-        "AK",
-        "AZ",
-        "AR",
-        "CA",
-        "CO",
-        "CT",
-        "DE",
-        "FL",
-        "GA",
-        "HI",
-        "ID",
-        "IL",
-        "IN",
-        "IA",
-        "KS",
-        "KY",
-        "LA",
-        "ME",
-        "MD",
-        "MA",
-        "MI",
-        "MN",
-        "MS",
-        "MO",
-        "MT",
-        "NE",
-        "NV",
-        "NH",
-        "NJ",
-        "NM",
-        "NY",
-        "NC",
-        "ND",
-        "OH",
-        "OK",
-        "OR",
-        "PA",
-        "RI",
-        "SC",
-        "SD",
-        "TN",
-        "TX",
-        "UT",
-        "VT",
-        "VA",
-        "WA",
-        "WV",
-        "WI",
-        "WY",
-        "DC",
-    ]
-    abbrev_pattern = r"\b(" + "|".join(us_state_abbrevs) + r")\b"
-    return bool(re.search(abbrev_pattern, location, flags=re.IGNORECASE))
-
-
-def append_log(path: str, row: dict) -> None:
-    file_exists = Path(path).exists()
-    with open(path, "a", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=["email", "company", "timestamp", "status"])
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(row)
+    return mentions_us_state(normalized)
+
+
+def open_log_writer(path: str) -> tuple[TextIO, csv.DictWriter]:
+    # Line-buffered: each row reaches the file as soon as its send completes, so a crash
+    # mid-batch cannot lose the record that stops the next run from re-sending.
+    handle = open(path, "a", newline="", encoding="utf-8", buffering=1)
+    writer = csv.DictWriter(handle, fieldnames=LOG_FIELDS)
+    # Append mode positions at end of file, so offset 0 means a new or empty log.
+    if handle.tell() == 0:
+        writer.writeheader()
+    return handle, writer
+
+
+def deliver(
+    sender_pool: SmtpSenderPool | None, recipient: str, subject: str, body: str, attachment_path: str
+) -> tuple[str, str]:
+    status = "skipped"
+    try:
+        if not sender_pool:
+            status = "dry_run"
+        else:
+            sender = sender_pool.sender()
+            message = sender.build_message(
+                recipient=recipient,
+                subject=subject,
+                body=body,
+                attachment_path=attachment_path,
+            )
+            sender.send_prepared(message)
+            status = "sent"
+    except Exception:
+        status = "failed"
+    return status, dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
 
 
 def ensure_env_file(base_dir: Path) -> None:
@@ -212,72 +294,70 @@ def main() -> None:
 
     job_sources = load_yaml(str(config_dir / "job_sources.yaml"))
     email_config = load_yaml(str(config_dir / "email_config.yaml"))
-
-    greenhouse = GreenhouseCollector()
-    lever = LeverCollector()
-
-    jobs = []
-    for entry in job_sources.get("ats_sources", {}).get("greenhouse", []):
-        company_domain = entry.get("company_domain")
-        fetched = greenhouse.fetch_jobs(entry["company_slug"], entry["careers_url"])
-        for job in fetched:
-            job.company_domain = company_domain
-        jobs.extend(fetched)
-    for entry in job_sources.get("ats_sources", {}).get("lever", []):
-        company_domain = entry.get("company_domain")
-        fetched = lever.fetch_jobs(entry["company_slug"], entry["careers_url"])
-        for job in fetched:
-            job.company_domain = company_domain
-        jobs.extend(fetched)
-
-    us_jobs = [job for job in jobs if is_us_location(job.location)]
-    if jobs and not us_jobs:
-        print("[warn] No jobs matched USA/United States location filter.")
-    jobs = us_jobs
-
-    write_companies_csv(str(data_dir / "companies.csv"), jobs)
-    print(f"[info] Collected {len(jobs)} jobs.")
-
-    job_boards = job_sources.get("job_boards", [])
-    if job_boards:
-        write_job_board_urls_csv(str(data_dir / "job_board_urls.csv"), job_boards)
-        print(f"[info] Saved {len(job_boards)} job board search URLs.")
-
-    recruiters = []
-    seen_companies = set()
-    for job in jobs:
-        if job.company_name in seen_companies:
-            continue
-        seen_companies.add(job.company_name)
-        recruiters.extend(identify_recruiters(job.company_name, job.careers_url))
+    send_workers = int(email_config["rate_limit"].get("parallel_connections", 1))
+    if send_workers < 1:
+        # Fail before any collection or rendering work rather than at the send pool.
+        raise ValueError("rate_limit.parallel_connections must be at least 1")
+
+    greenhouse = GreenhouseCollector(session=build_session())
+    lever = LeverCollector(session=build_session())
+
+    ats_sources = job_sources.get("ats_sources", {})
+    tasks = [(greenhouse, entry) for entry in ats_sources.get("greenhouse", [])]
+    tasks.extend((lever, entry) for entry in ats_sources.get("lever", []))
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        # map() preserves submission order, so output matches the sequential run.
+        jobs = list(chain.from_iterable(executor.map(lambda task: fetch_source(*task), tasks)))
+
+        us_jobs = [job for job in jobs if is_us_location(job.location)]
+        if jobs and not us_jobs:
+            print("[warn] No jobs matched USA/United States location filter.")
+        jobs = us_jobs
+
+        write_companies_csv(str(data_dir / "companies.csv"), jobs)
+        print(f"[info] Collected {len(jobs)} jobs.")
+
+        job_boards = job_sources.get("job_boards", [])
+        if job_boards:
+            write_job_board_urls_csv(str(data_dir / "job_board_urls.csv"), job_boards)
+            print(f"[info] Saved {len(job_boards)} job board search URLs.")
+
+        # First job per company; drives recruiter lookup and the send-loop context.
+        job_lookup: Dict[str, CompanyJob] = {}
+        for job in jobs:
+            job_lookup.setdefault(job.company_name, job)
+        recruiters = list(
+            chain.from_iterable(
+                executor.map(
+                    lambda job: identify_recruiters(job.company_name, job.careers_url), job_lookup.values()
+                )
+            )
+        )
 
     write_recruiters_csv(str(data_dir / "recruiters.csv"), recruiters)
     print(f"[info] Identified {len(recruiters)} recruiter contacts.")
 
-    validator = EmailValidator()
-    emails = []
-    recruiter_company_map: Dict[str, str] = {}
-    company_domain_map: Dict[str, str] = {}
-    for job in jobs:
-        if job.company_domain:
-            company_domain_map[job.company_name] = job.company_domain
-    for recruiter in recruiters:
-        recruiter_company_map[recruiter.recruiter_name] = recruiter.company_name
-        company_domain = company_domain_map.get(recruiter.company_name)
-        emails.extend(
-            discover_from_careers_url(
+    company_domain_map: Dict[str, str] = {job.company_name: job.company_domain for job in jobs if job.company_domain}
+    recruiter_company_map: Dict[str, str] = {
+        recruiter.recruiter_name: recruiter.company_name for recruiter in recruiters
+    }
+
+    with EmailValidator() as validator:
+        emails = [
+            email
+            for recruiter in recruiters
+            for email in discover_from_careers_url(
                 recruiter.recruiter_name,
                 recruiter.profile_url,
                 validator,
-                company_domain=company_domain,
+                company_domain=company_domain_map.get(recruiter.company_name),
             )
-        )
+        ]
 
-    deduped_emails = {}
+    deduped_emails: Dict[str, DiscoveredEmail] = {}
     for email in emails:
-        if email.email not in deduped_emails:
-            deduped_emails[email.email] = email
-
+        deduped_emails.setdefault(email.email, email)
     emails = list(deduped_emails.values())
     write_emails_csv(str(data_dir / "emails.csv"), emails)
     print(f"[info] Discovered {len(emails)} unique emails.")
@@ -285,33 +365,40 @@ def main() -> None:
     personalizer = EmailPersonalizer(str(config_dir / "prompt_templates"))
     footer_text = email_config.get("compliance", {}).get("unsubscribe_text", "")
     footer = UnsubscribeFooter(text=footer_text)
+    footer_rendered = footer.render()
 
     smtp_config = load_smtp_config()
-    sender = SmtpSender(smtp_config) if smtp_config else None
-    if not sender:
+    sender_pool = SmtpSenderPool(smtp_config) if smtp_config else None
+    if not sender_pool:
         print("[info] SMTP sender not configured; running in dry-run mode.")
 
     rate_limit = RateLimiter(
         daily_limit=int(os.getenv("DAILY_EMAIL_LIMIT", email_config["rate_limit"]["daily_limit"])),
         min_seconds_between_sends=email_config["rate_limit"]["min_seconds_between_sends"],
     )
-    logs = read_logs(os.getenv("EMAIL_LOG_PATH", str(data_dir / "sent_logs.csv")))
-    already_sent = {row.get("email") for row in logs}
+    log_path = os.getenv("EMAIL_LOG_PATH", str(data_dir / "sent_logs.csv"))
+    # One streaming pass: the exact set of past recipients plus today's count, no row list.
+    already_sent = set()
+    for row in iter_logs(log_path):
+        already_sent.add(row.get("email"))
+        rate_limit.observe(row)
 
     candidate_profile = os.getenv("CANDIDATE_PROFILE", "relevant experience and skills")
     candidate_name = os.getenv("CANDIDATE_NAME", "Candidate Name")
     candidate_email = os.getenv("CANDIDATE_EMAIL", "candidate@example.com")
-
-    job_lookup = {job.company_name: job for job in jobs}
+    resume_path = os.getenv("RESUME_PATH", str(base_dir / "resumes" / "candidate_resume.pdf"))
 
     if not emails:
         print("[warn] No emails discovered; nothing to send.")
 
+    # Rate-limit slots are reserved here, in order; only delivery runs concurrently.
+    outgoing = []
     for email in emails:
         if email.email in already_sent:
             continue
-        if not rate_limit.can_send(logs):
+        if not rate_limit.can_send():
             break
+        rate_limit.record()
 
         company = recruiter_company_map.get(email.recruiter_name, "")
         job = job_lookup.get(company)
@@ -326,35 +413,20 @@ def main() -> None:
             "candidate_email": candidate_email,
         }
         personalized = personalizer.personalize(context)
-        body = f"{personalized.body}{footer.render()}"
-
-        status = "skipped"
-        try:
-            if not sender:
-                status = "dry_run"
-            else:
-                sender.send_email(
-                    recipient=email.email,
-                    subject=personalized.subject,
-                    body=body,
-                    attachment_path=os.getenv("RESUME_PATH", str(base_dir / "resumes" / "candidate_resume.pdf")),
-                )
-                status = "sent"
-        except Exception:
-            status = "failed"
-
-        timestamp = dt.datetime.utcnow().isoformat()
-        log_path = os.getenv("EMAIL_LOG_PATH", str(data_dir / "sent_logs.csv"))
-        append_log(
-            log_path,
-            {
-                "email": email.email,
-                "company": company,
-                "timestamp": timestamp,
-                "status": status,
-            },
-        )
-        logs.append({"email": email.email, "timestamp": timestamp})
+        outgoing.append((email.email, company, personalized.subject, personalized.body + footer_rendered))
+
+    log_handle, log_writer = open_log_writer(log_path)
+    with log_handle, sender_pool or nullcontext(), ThreadPoolExecutor(max_workers=send_workers) as executor:
+        results = executor.map(lambda item: deliver(sender_pool, item[0], item[2], item[3], resume_path), outgoing)
+        for (recipient, company, _, _), (status, timestamp) in zip(outgoing, results):
+            log_writer.writerow(
+                {
+                    "email": recipient,
+                    "company": company,
+                    "timestamp": timestamp,
+                    "status": status,
+                }
+            )
 
 
 if __name__ == "__main__":